@@ -6,6 +6,7 @@ Here are defined main objects for running the following command:
 
 import inspect
 import importlib
+import re
 import sys
 
 from typing import Any, List, Optional, Tuple
@@ -14,6 +15,23 @@ from doksit.data_types import MyOrderedDict
 from doksit.exceptions import InvalidObject
 from doksit.models import Base, DocstringParser, VARIABLE_REGEX
 
+# Docstring headers with names of methods for markdowning their sections and
+# whether those methods need the documented object too.
+
+SECTIONS = {
+    "Args:": ("markdown_arguments_section", True),
+    "Arguments:": ("markdown_arguments_section", True),
+    "Attributes:": ("markdown_attributes_section", False),
+    "Note:": ("markdown_note_section", False),
+    "Raises:": ("markdown_raises_section", False),
+    "Returns:": ("markdown_returns_section", True),
+    "Todo:": ("markdown_todo_section", False),
+    "Warning:": ("markdown_warning_section", False),
+    "Yields:": ("markdown_yields_section", True)
+}
+SECTION_REGEX = re.compile(
+    "^(?:" + "|".join(map(re.escape, SECTIONS)) + "|Example:)", re.MULTILINE)
+
 
 class DoksitStyle(Base, DocstringParser):
     """
@@ -26,7 +44,7 @@ class DoksitStyle(Base, DocstringParser):
 
     Other attributes are defined separately in properties.
     """
-    __slots__ = ("package")
+    __slots__ = ("package",)
 
     def __init__(self, package: str, title: str) -> None:
         """
@@ -40,6 +58,7 @@ class DoksitStyle(Base, DocstringParser):
         """
         self.package = package[:-1] if package.endswith("/") else package
         self._title = title
+        self._markdowned_docstrings = {}
 
     @property
     def alphabetically(self) -> bool:
@@ -137,8 +156,8 @@ class DoksitStyle(Base, DocstringParser):
             with open("docs/_api.md") as file:
                 file_content = file.read()
 
-            for file in file_paths:
-                file_metadata = self.read_file(file)
+            for file_metadata in self.read_files(file_paths):
+                file = file_metadata[0]
                 file_documentation = self._get_documentation(file_metadata)
 
                 if file_documentation is not None:
@@ -155,8 +174,7 @@ class DoksitStyle(Base, DocstringParser):
         else:
             api_documentation = "# " + self.title + "\n\n"
 
-            for file in file_paths:
-                file_metadata = self.read_file(file)
+            for file_metadata in self.read_files(file_paths):
                 file_documentation = self._get_documentation(file_metadata)
 
                 if file_documentation is not None:
@@ -194,8 +212,7 @@ class DoksitStyle(Base, DocstringParser):
 
             ...
         """
-        class_doc = "### class {class_name}\n\n" \
-            .format(class_name=class_name)
+        class_doc = "### class " + class_name + "\n\n"
 
         class_obj = getattr(module, class_name)
         class_doc += self.get_source_code_url(module, class_obj)
@@ -237,13 +254,10 @@ class DoksitStyle(Base, DocstringParser):
 
             ...
         """
-        classes_doc = ""
-
-        for class_name in classes:
-            classes_doc += self.get_class_documentation(module, class_name,
-                                                        classes[class_name])
+        get_class_documentation = self.get_class_documentation
 
-        return classes_doc
+        return "".join(get_class_documentation(module, class_name, methods)
+                       for class_name, methods in classes.items())
 
     def get_function_documentation(self, module: Any, function_name: str) \
             -> str:
@@ -266,8 +280,7 @@ class DoksitStyle(Base, DocstringParser):
 
             This is a function docstring.
         """
-        function_doc = "### function {function_name}\n\n" \
-            .format(function_name=function_name)
+        function_doc = "### function " + function_name + "\n\n"
 
         function_obj = getattr(module, function_name)
         function_doc += self.get_source_code_url(module, function_obj)
@@ -300,13 +313,10 @@ class DoksitStyle(Base, DocstringParser):
 
             ...
         """
-        functions_doc = ""
+        get_function_documentation = self.get_function_documentation
 
-        for function_name in functions:
-            functions_doc += \
-                self.get_function_documentation(module, function_name)
-
-        return functions_doc
+        return "".join(get_function_documentation(module, function_name)
+                       for function_name in functions)
 
     def get_markdowned_docstring(self, object_name: Any) -> str:
         """
@@ -317,6 +327,11 @@ class DoksitStyle(Base, DocstringParser):
                 For which object (module, class, method, function) to get its
                 docstring.
 
+        Note:
+            Results are cached per object in this instance, so markdowning
+            the same object again (eg. generating the documentation more
+            times) is only a lookup.
+
         Returns:
             The markdowned docstring or empty string (the object
             doesn't have any docstring.)
@@ -338,41 +353,13 @@ class DoksitStyle(Base, DocstringParser):
             - bool:
                 - True if something.
         """
-        docstring = inspect.getdoc(object_name)
+        markdowned_docstrings = self._markdowned_docstrings
 
-        if not docstring:
-            return ""
+        if object_name not in markdowned_docstrings:
+            markdowned_docstrings[object_name] = \
+                self._markdown_docstring(object_name)
 
-        split_docstring = docstring.split("\n")
-        headers = {
-            "Args:": self.markdown_arguments_section,
-            "Arguments:": self.markdown_arguments_section,
-            "Attributes:": self.markdown_attributes_section,
-            "Note:": self.markdown_note_section,
-            "Raises:": self.markdown_raises_section,
-            "Returns:": self.markdown_returns_section,
-            "Todo:": self.markdown_todo_section,
-            "Warning:": self.markdown_warning_section,
-            "Yields:": self.markdown_yields_section
-        }
-
-        # Method for "Example:" header is handled separately, because
-        # it may be also "Example: (markdown)".
-
-        for line_number, line in enumerate(split_docstring):
-            if line.startswith("Example:"):
-                split_docstring = \
-                    self.markdown_example_section(line_number,
-                                                  split_docstring)
-
-            elif line in ["Args:", "Arguments:", "Returns:", "Yields:"]:
-                split_docstring = headers[line](line_number, split_docstring,
-                                                object_name)
-
-            elif line in headers:
-                split_docstring = headers[line](line_number, split_docstring)
-
-        return "\n".join(split_docstring)
+        return markdowned_docstrings[object_name]
 
     def get_method_documentation(self, module: Any, method: Any,
                                  method_name: str) -> str:
@@ -407,12 +394,11 @@ class DoksitStyle(Base, DocstringParser):
             method_documentation = "\n\n#### constructor\n\n"
 
         elif isinstance(method, property):
-            method_documentation = "\n\n#### property {method_name}\n\n" \
-                .format(method_name=method_name)
+            method_documentation = \
+                "\n\n#### property " + method_name + "\n\n"
 
         else:
-            method_documentation = "\n\n#### method {method_name}\n\n" \
-                .format(method_name=method_name)
+            method_documentation = "\n\n#### method " + method_name + "\n\n"
 
         method_documentation += self.get_source_code_url(module, method)
         method_documentation += self.get_markdowned_docstring(method)
@@ -455,7 +441,7 @@ class DoksitStyle(Base, DocstringParser):
             end_of_heading = module_docstring.index("\n")
             heading_line = module_docstring[:end_of_heading + 2]  # `\n\n`.
 
-            module_docstring = module_docstring.lstrip(heading_line)
+            module_docstring = module_docstring[len(heading_line):]
             module_heading = "#" + heading_line
 
         elif "{{ " in module_docstring:
@@ -463,8 +449,7 @@ class DoksitStyle(Base, DocstringParser):
                 "## " + str.title(module_name.split(".")[-1]) + "\n\n"
 
         else:
-            module_heading = "## {module_name}\n\n" \
-                .format(module_name=module_name)
+            module_heading = "## " + module_name + "\n\n"
 
         return module_heading + module_url + module_docstring + "\n\n"
 
@@ -489,7 +474,7 @@ class DoksitStyle(Base, DocstringParser):
         if not classes and not functions:
             return None
 
-        module_path = file_path.replace("/", ".").rstrip(".py")
+        module_path = file_path[:-len(".py")].replace("/", ".")
 
         try:
             imported_module = importlib.import_module(module_path)
@@ -560,6 +545,54 @@ class DoksitStyle(Base, DocstringParser):
 
         return documentation
 
+    def _markdown_docstring(self, object_name: Any) -> str:
+        """
+        Get the object docstring and convert it to Markdown format.
+
+        Arguments:
+            object_name:
+                For which object to get its docstring.
+
+        Note:
+            The sections are markdowned by methods of this instance, so
+            a subclass may override them.
+
+        Returns:
+            See `get_markdowned_docstring` method.
+        """
+        docstring = inspect.getdoc(object_name)
+
+        if not docstring:
+            return ""
+
+        if not SECTION_REGEX.search(docstring):  # Nothing to markdown.
+            return docstring
+
+        split_docstring = docstring.split("\n")
+
+        # Each line is looked up only once, the "Example:" header is handled
+        # separately, because it may be also "Example: (markdown)".
+
+        for line_number, line in enumerate(split_docstring):
+            section = SECTIONS.get(line)
+
+            if section is not None:
+                method_name, needs_object = section
+                method = getattr(self, method_name)
+
+                if needs_object:
+                    split_docstring = method(line_number, split_docstring,
+                                             object_name)
+                else:
+                    split_docstring = method(line_number, split_docstring)
+
+            elif line.startswith("Example:"):
+                split_docstring = \
+                    self.markdown_example_section(line_number,
+                                                  split_docstring)
+
+        return "\n".join(split_docstring)
+
     @staticmethod
     def _order_classes(module: Any, classes: MyOrderedDict) -> MyOrderedDict:
         """
@@ -14,6 +14,7 @@ Warning:
 
 import os
 import subprocess
+import sys
 
 import click
 
@@ -61,15 +62,32 @@ def api(package: str, title: str, smooth: bool, colored: bool) \
     api_parser = DoksitStyle(package, title)
     api_documentation = api_parser.get_api_documentation()
 
+    if colored and not sys.stdout.isatty():
+        # Nobody would see the colors, so at least the smooth output (without
+        # escape sequences, if it's redirected) is used. The `NO_COLOR`
+        # variable isn't checked, because the colors were asked explicitly.
+        colored, smooth = False, True
+
     if colored:
         colored_parser = ColoredHighlighter(api_documentation)
-        colored_documentation = colored_parser.get_api_documentation()
 
-        read, write = os.pipe()
-        os.write(write, colored_documentation.encode("ascii"))
-        os.close(write)
+        # The colored output is written to `less` line by line, so it's never
+        # kept in memory as a whole.
+
+        try:
+            less = subprocess.Popen(["less", "-r"], stdin=subprocess.PIPE,
+                                    universal_newlines=True)
+        except OSError:  # `less` isn't installed.
+            click.echo_via_pager(colored_parser.get_api_documentation())
+            return
+
+        try:
+            colored_parser.write_api_documentation(less.stdin)
+            less.stdin.close()
+        except BrokenPipeError:  # `less` was quit before the end.
+            pass
 
-        subprocess.call(["less", "-r"], stdin=read)
+        less.wait()
     elif smooth:
         smooth_parser = SmoothHighlighter(api_documentation)
 
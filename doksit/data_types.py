@@ -20,4 +20,4 @@ class MyOrderedDict(collections.OrderedDict):
         Example:
             "foo"
         """
-        return list(self.keys())[-1]
+        return next(reversed(self))
@@ -3,6 +3,8 @@ Here are defined base classes.
 """
 
 import abc
+import concurrent.futures
+import functools
 import inspect
 import os
 import os.path
@@ -13,11 +15,17 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML without LibYAML bindings.
+    from yaml import SafeLoader as YamlLoader
+
 from doksit.data_types import MyOrderedDict
 from doksit.helpers import validate_file_path
 
-REPOSITORY_URL_REGEX = re.compile(r"origin\t([\S]+) ")
-BRANCH_NAME_REGEX = re.compile(r"\* (.+)\n")
+BRANCH_REF_PREFIX = "ref: refs/heads/"  # In the `.git/HEAD` file.
+REMOTE_URL_REGEX = re.compile(
+    r'^\[remote "origin"\][^\[]*?^\s*url\s*=\s*(\S+)', re.ASCII | re.MULTILINE)
 
 VARIABLE_REGEX = re.compile(r"{{ ?([\S]+) ?}}")  # In a template / module doc.
 
@@ -34,6 +42,7 @@ class Base:
     based on different docstring style than is Doksit / Google style.
     """
     __metaclass__ = abc.ABCMeta
+    __slots__ = ()  # Otherwise no subclass could be without `__dict__`.
 
     @abc.abstractmethod
     def get_api_documentation(self):
@@ -51,17 +60,23 @@ class Base:
         Example:
             {"docstring": "doksit"}
 
+        Note:
+            The parsed content is cached in memory until the config file is
+            modified.
+
         Raises:
             yaml.YAMLError:
                 Invalid syntax in the config file.
         """
         try:
-            with open(".doksit.yml") as file:
-                file_content = file.read()
+            file_stat = os.stat(".doksit.yml")
         except FileNotFoundError:
             return None
 
-        return yaml.load(file_content)
+        cache_key = (os.path.abspath(".doksit.yml"), file_stat.st_mtime_ns,
+                     file_stat.st_size)
+
+        return self._load_config(cache_key)
 
     @property
     def current_branch(self) -> Optional[str]:
@@ -73,14 +88,28 @@ class Base:
 
         Example:
             "master"
+
+        Note:
+            The `.git/HEAD` file is read directly, Git is called only if it's
+            missing (eg. in a subdirectory of the repository). On a detached
+            HEAD the commit hash is returned.
         """
-        try:
-            current_branch = subprocess.check_output(
-                ["git", "branch"], universal_newlines=True)
-        except subprocess.CalledProcessError:
-            return None
+        directory = os.getcwd()
+        head = self._read_git_file(directory, "HEAD")
 
-        return BRANCH_NAME_REGEX.search(current_branch).group(1)
+        if head is None:
+            branch = self._get_git_output(directory, "rev-parse",
+                                          "--abbrev-ref", "HEAD")
+
+            if branch == "HEAD":  # Detached HEAD, eg. a checkout on CI.
+                return self._get_git_output(directory, "rev-parse", "HEAD")
+            else:
+                return branch
+
+        if head.startswith(BRANCH_REF_PREFIX):
+            return head[len(BRANCH_REF_PREFIX):]
+        else:
+            return head  # Detached HEAD, the commit hash is fine for GitHub.
 
     @property
     def has_template(self) -> bool:
@@ -101,9 +130,11 @@ class Base:
         Example:
             "https://github.com/nait-aul/doksit/blob/master/"
         """
-        if self.repository_url is not None and self.current_branch is not \
-                None:
-            return self.repository_url + "/blob/" + self.current_branch + "/"
+        repository_url = self.repository_url
+        current_branch = self.current_branch
+
+        if repository_url is not None and current_branch is not None:
+            return repository_url + "/blob/" + current_branch + "/"
         else:
             return None
 
@@ -117,15 +148,23 @@ class Base:
 
         Example:
             "https://github.com/nait-aul/doksit"
+
+        Note:
+            The `.git/config` file is read directly, Git is called only if
+            it's missing (eg. in a subdirectory of the repository).
         """
-        try:
-            remote_repository = subprocess.check_output(
-                ["git", "remote", "-v"], universal_newlines=True)
-        except subprocess.CalledProcessError:
-            return None
+        directory = os.getcwd()
+        git_config = self._read_git_file(directory, "config")
+
+        if git_config is None:
+            repository_url = self._get_git_output(directory, "config", "--get",
+                                                  "remote.origin.url")
+        else:
+            match = REMOTE_URL_REGEX.search(git_config)
+            repository_url = match.group(1) if match else None
 
-        repository_url = \
-            REPOSITORY_URL_REGEX.search(remote_repository).group(1)
+        if repository_url is None:
+            return None
 
         if repository_url.endswith(".git"):
             repository_url = repository_url[:-4]
@@ -163,17 +202,17 @@ class Base:
             found_paths = VARIABLE_REGEX.findall(file_content)
 
             for file in found_paths:
-                file_paths.append(os.path.join(package, file))
+                file_path = os.path.join(package, file)
 
-            validated_paths = tuple(map(validate_file_path, file_paths))
+                # Stop at the first invalid path, the rest need not be
+                # checked at all.
 
-            if False in validated_paths:
-                which_file_path = validated_paths.index(False)
-                invalid_file_path = found_paths[which_file_path]
+                if not validate_file_path(file_path):
+                    raise ValueError("Invalid file path '{file_path}' in the "
+                                     "'docs/_api.md' template.".format(
+                                         file_path=file))
 
-                raise ValueError("Invalid file path '{file_path}' in the "
-                                 "'docs/_api.md' template.".format(
-                                     file_path=invalid_file_path))
+                file_paths.append(file_path)
         else:
             ignored_files = ("__init__.py", "__main__.py")
 
@@ -186,6 +225,7 @@ class Base:
         return file_paths
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_line_numbers(object_name: Any) -> str:
         """
         Find on which lines is the given object defined / located.
@@ -200,6 +240,9 @@ class Base:
             will be silenced and returned only `#`. The same goes for class
             properties.
 
+            Results are cached per object, so the source file is tokenized
+            only once for each object.
+
         Returns:
             Range, where the object definition starts and ends.
 
@@ -213,8 +256,7 @@ class Base:
 
         ending_line = starting_line + len(source_lines) - 1
 
-        return "#L{starting_line}-L{ending_line}" \
-            .format(starting_line=starting_line, ending_line=ending_line)
+        return "#L" + str(starting_line) + "-L" + str(ending_line)
 
     def get_source_code_url(self, module: Any, object_name: Any=None) -> str:
         """
@@ -240,12 +282,11 @@ class Base:
 
         if repository_prefix is not None:
             module_path = module.__name__.replace(".", "/") + ".py"
-            url = "[source](" + str(repository_prefix) + module_path
 
             if object_name is not None:
-                url += self.get_line_numbers(object_name)
+                module_path += self.get_line_numbers(object_name)
 
-            return url + ")\n\n"
+            return "[source](" + repository_prefix + module_path + ")\n\n"
         else:
             return ""
 
@@ -277,11 +318,13 @@ class Base:
             file_content = file.readlines()
 
         classes = MyOrderedDict()
+        class_methods = None  # Methods of the last found class.
         functions = []
 
         for line_number, line in enumerate(file_content):
             if line.startswith("class "):
-                classes[CLASS_REGEX.search(line).group(1)] = []
+                class_methods = []
+                classes[CLASS_REGEX.search(line).group(1)] = class_methods
 
             elif line.lstrip().startswith("def "):
                 if METHOD_REGEX.search(line):
@@ -289,7 +332,7 @@ class Base:
 
                     if method_name == "__init__" or \
                             not method_name.startswith("_"):
-                        classes[classes.last()].append(method_name)
+                        class_methods.append(method_name)
 
                 elif FUNCTION_REGEX.search(line):
                     function_name = FUNCTION_REGEX.search(line).group(1)
@@ -304,15 +347,111 @@ class Base:
                         method_name = STATIC_METHOD_REGEX.search(line).group(1)
 
                         if not method_name.startswith("_"):
-                            classes[classes.last()].append(method_name)
+                            class_methods.append(method_name)
 
         return file_path, classes, functions
 
+    def read_files(self, file_paths: List[str]) \
+            -> List[Tuple[str, MyOrderedDict, List[str]]]:
+        """
+        Read the given files in parallel (see the `read_file` method).
+
+        Files are independent on each other and reading them is mostly
+        waiting for I/O, so threads are sufficient.
+
+        Arguments:
+            file_paths:
+                Relative paths to Python files.
+
+        Returns:
+            Metadata for each file in the same order as the given file paths.
+        """
+        if not file_paths:
+            return []
+
+        max_workers = min(32, len(file_paths))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(self.read_file, file_paths))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_git_output(directory: str, *arguments: str) -> Optional[str]:
+        """
+        Run the given Git command in the directory and get its output.
+
+        Arguments:
+            directory:
+                Absolute path to the directory, where to run the command.
+            *arguments:
+                Arguments of the `git` command.
+
+        Note:
+            The output is cached, because the same commands would be run for
+            each documented object.
+
+        Returns:
+            The output without a trailing newline or `None`, if the command
+            failed (eg. the directory is not a Git repository).
+        """
+        try:
+            output = subprocess.check_output(
+                ["git"] + list(arguments), cwd=directory,
+                universal_newlines=True)
+        except subprocess.CalledProcessError:
+            return None
+
+        return output.rstrip("\n")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_config(cache_key: Tuple[str, int, int]) -> Dict[str, Any]:
+        """
+        Load the config file.
+
+        Arguments:
+            cache_key:
+                Absolute path to the config file, its modification time (in
+                nanoseconds) and size. The file is parsed again only for
+                a new key.
+
+        Returns:
+            Parsed content of the config file.
+        """
+        with open(cache_key[0]) as file:
+            return yaml.load(file.read(), Loader=YamlLoader)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _read_git_file(directory: str, file_name: str) -> Optional[str]:
+        """
+        Read the given file from the `.git/` directory.
+
+        Arguments:
+            directory:
+                Absolute path to the directory containing `.git/`.
+            file_name:
+                Name of the file, eg. "HEAD".
+
+        Returns:
+            Content of the file without surrounding whitespaces or `None`, if
+            the file can't be read.
+        """
+        try:
+            with open(os.path.join(directory, ".git", file_name)) as file:
+                return file.read().strip()
+        except OSError:
+            return None
+
 
-ARGUMENT_REGEX = re.compile(r"([\w_\*]+)")
 BUILTIN_TYPE_REGEX = re.compile(r"<class '([\S]+)'>")
 LANGUAGE_REGEX = re.compile(r"Example: \((\w+)\)")
-PARAMETER_REGEX = re.compile(r"[\w_]+:?([\w_\[\]\.]+)?=?(.+)?")
+
+SKIPPED_PARAMETERS = frozenset(("self", "cls"))
+
+INDENT_4 = "    "
+INDENT_6 = "      "
+INDENT_7 = "       "
 
 
 class DocstringParser:
@@ -398,20 +537,23 @@ class DocstringParser:
 
             docstring[line_number] = "**Arguments:**\n"
 
-        for number, line in enumerate(docstring[line_number + 1:],
-                                      start=line_number + 1):
-            if line.startswith(" " * 8):  # Argument description.
-                lstrip_line = line.lstrip(" ")
+        for number in range(line_number + 1, len(docstring)):
+            line = docstring[number]
+
+            if not line:  # End of the `Arguments` section.
+                break
+
+            lstrip_line = line.lstrip(" ")
+            indentation = len(line) - len(lstrip_line)
 
+            if indentation >= 8:  # Argument description.
                 if is_first_line_description:
                     docstring[number] = "    - " + lstrip_line
                     is_first_line_description = False
                 else:
-                    docstring[number] = " " * 6 + lstrip_line
-
-            elif line.startswith(" " * 4):  # Line with argument name.
-                lstrip_line = line.lstrip(" ")
+                    docstring[number] = INDENT_6 + lstrip_line
 
+            elif indentation >= 4:  # Line with argument name.
                 if line.endswith(":"):
                     docstring[number] = "- " + lstrip_line
                     is_first_line_description = True  # For the next line.
@@ -420,20 +562,16 @@ class DocstringParser:
                     colon_index = lstrip_line.index(":")
                     docstring[number] = "- " + lstrip_line[:colon_index + 1]
 
-                    insert_text.append((number + 1,
+                    insert_text.append((number,
                                         lstrip_line[colon_index + 2:]))
 
                 if is_arguments_section and ":" in lstrip_line and "(" not in \
                         lstrip_line:
-                    argument_name = ARGUMENT_REGEX.search(line).group(1)
+                    argument_name = lstrip_line.partition(":")[0].rstrip(" ")
                     docstring[number] = "- " + parsed_parameters[argument_name]
 
-            elif line == "":  # End of the `Arguments` section.
-                break
-
         if insert_text:
-            for index, text in reversed(insert_text):
-                docstring.insert(index, "    - " + text)
+            docstring = self._insert_descriptions(docstring, insert_text)
 
         return docstring
 
@@ -501,40 +639,38 @@ class DocstringParser:
         """
         example_header = docstring[line_number]
 
-        if LANGUAGE_REGEX.search(example_header):
-            language = LANGUAGE_REGEX.search(example_header).group(1)
+        language_match = LANGUAGE_REGEX.match(example_header)
+
+        if language_match:
+            language = language_match.group(1)
 
             docstring[line_number] = "Example:"
         else:
             language = "python"
 
-        for number, line in enumerate(docstring[line_number + 1:],
-                                      start=line_number + 1):
-            if line.startswith("     "):  # Indendation in the codes.
-                docstring[number] = line[4:]
+        example_end = len(docstring) - 1  # Last line of the codes.
 
-            elif line.startswith("    "):
-                docstring[number] = line.lstrip(" ")
+        for number in range(line_number + 1, len(docstring)):
+            line = docstring[number]
+
+            if line.startswith(INDENT_4):  # Keep the indentation in the codes.
+                docstring[number] = line[4:]
 
             elif line == "":  # End of the `Example` section or a line break.
-                try:
-                    if docstring[number + 1].startswith("    "):
-                        continue
-                    else:
-                        example_end = number - 1
-                        break
-                except IndexError:
+                next_line = docstring[number + 1:number + 2]
+
+                if not next_line or not next_line[0].startswith(INDENT_4):
                     example_end = number - 1
+                    break
 
-        line_with_language = "\n```{language}".format(language=language)
-        docstring.insert(line_number + 1, line_with_language)
+        line_with_language = "\n```" + language
 
-        try:
-            assert example_end
-        except NameError:
-            example_end = len(docstring)
+        # Wrap the codes with both fences at once, so the rest of the
+        # docstring is shifted only one time.
 
-        docstring.insert(example_end + 2, "```")  # New line was inserted.
+        codes = docstring[line_number + 1:example_end + 1]
+        docstring[line_number + 1:example_end + 1] = \
+            [line_with_language] + codes + ["```"]
 
         return docstring
 
@@ -625,43 +761,45 @@ class DocstringParser:
         is_first_line_description = False
         insert_text = []  # For descriptions on the same line as error names.
 
-        for number, line in enumerate(docstring[line_number + 1:],
-                                      start=line_number + 1):
-            if line.startswith(" " * 11):
-                docstring[number] = " " * 7 + line.lstrip(" ")
+        for number in range(line_number + 1, len(docstring)):
+            line = docstring[number]
+            lstrip_line = line.lstrip(" ")
+            indentation = len(line) - len(lstrip_line)
 
-            elif line.startswith(" " * 8):
-                lstrip_line = line.lstrip(" ")
+            if indentation >= 11:
+                docstring[number] = INDENT_7 + lstrip_line
 
-                if lstrip_line[0].isdigit() and lstrip_line[1] == ".":
-                    docstring[number] = " " * 4 + lstrip_line
+            elif indentation >= 8:
+                if lstrip_line[:1].isdigit() and lstrip_line[1:2] == ".":
+                    docstring[number] = INDENT_4 + lstrip_line
                 else:
                     if is_first_line_description:
                         docstring[number] = "    - " + lstrip_line
                         is_first_line_description = False
                     else:
-                        docstring[number] = " " * 6 + lstrip_line
-
-            elif line.startswith(" " * 4):
-                lstrip_line = line.lstrip(" ")
+                        docstring[number] = INDENT_6 + lstrip_line
 
+            elif indentation >= 4:
                 if line.endswith(":"):
                     docstring[number] = "- " + lstrip_line
                     is_first_line_description = True  # For the next line.
 
-                elif ":" in lstrip_line:
-                    colon_index = lstrip_line.index(":")
-                    docstring[number] = "- " + lstrip_line[:colon_index + 1]
+                else:
+                    colon_index = lstrip_line.find(":")
 
-                    insert_text.append((number + 1,
-                                        lstrip_line[colon_index + 2:]))
+                    if colon_index != -1:
+                        docstring[number] = \
+                            "- " + lstrip_line[:colon_index + 1]
+
+                        insert_text.append((number,
+                                            lstrip_line[colon_index + 2:]))
 
-            elif line.startswith(""):  # End of the `Raises` section.
+            else:  # End of the `Raises` section.
                 break
 
         if insert_text:
-            for index, text in reversed(insert_text):
-                docstring.insert(index, "    - " + text)
+            docstring = DocstringParser._insert_descriptions(docstring,
+                                                             insert_text)
 
         return docstring
 
@@ -723,10 +861,10 @@ class DocstringParser:
             docstring = self._align_rest_return(docstring, line_number + 3)
 
         elif ":" in return_first_line:  # 3rd option from the docstring.
-            colon_index = return_first_line.find(":")
-            return_annotation = return_first_line[:colon_index + 1][4:]
-            return_description = return_first_line[colon_index + 2:]
-            docstring[line_number + 1] = "- " + return_annotation
+            return_annotation, _, return_description = \
+                return_first_line.partition(":")
+            return_description = return_description[1:]  # Without space.
+            docstring[line_number + 1] = "- " + return_annotation[4:] + ":"
 
             docstring = self._align_rest_return(docstring, line_number + 2)
             docstring.insert(line_number + 2, "    - " + return_description)
@@ -779,19 +917,20 @@ class DocstringParser:
         """
         docstring[line_number] = "**" + docstring[line_number] + "**\n"
 
-        for number, line in enumerate(docstring[line_number + 1:],
-                                      start=line_number + 1):
-            if line.startswith("    -"):
-                docstring[number] = line.replace("    -", "- [ ]")
+        for number in range(line_number + 1, len(docstring)):
+            line = docstring[number]
 
-            elif line.startswith("    *"):
-                docstring[number] = line.replace("    *", "- [ ]")
+            if not line:  # End of the `Todo` section.
+                break
 
-            elif line.startswith(" " * 4):
-                docstring[number] = " " * 6 + line.lstrip(" ")
+            lstrip_line = line.lstrip(" ")
+            indentation = len(line) - len(lstrip_line)
 
-            elif line == "":  # End of the `Todo` section.
-                break
+            if indentation == 4 and lstrip_line[:1] in ("-", "*"):
+                docstring[number] = "- [ ]" + lstrip_line[1:]
+
+            elif indentation >= 4:
+                docstring[number] = INDENT_6 + lstrip_line
 
         return docstring
 
@@ -831,15 +970,52 @@ class DocstringParser:
             List[str]:
                 Updated original docstring.
         """
-        for line_number, line in enumerate(docstring[start:], start=start):
+        for line_number in range(start, len(docstring)):
+            line = docstring[line_number]
+
             if line == "":  # End of the `Returns:` section.
                 break
             else:
-                docstring[line_number] = " " * 6 + line.lstrip(" ")
+                docstring[line_number] = INDENT_6 + line.lstrip(" ")
 
         return docstring
 
     @staticmethod
+    def _insert_descriptions(docstring: List[str],
+                             descriptions: List[Tuple[int, str]]) -> List[str]:
+        """
+        Insert descriptions written on the same line as a name (eg.
+        `KeyError: Reason.`) below that line.
+
+        Arguments:
+            docstring (List[str]):
+                Split docstring.
+            descriptions (List[Tuple[int, str]]):
+                Line numbers with descriptions to be inserted after them.
+
+        Note:
+            The docstring is rebuilt in one pass and then updated in place,
+            because a caller may still iterate over it.
+
+        Returns:
+            List[str]:
+                Updated split docstring.
+        """
+        descriptions = dict(descriptions)
+        updated_docstring = []
+
+        for line_number, line in enumerate(docstring):
+            updated_docstring.append(line)
+
+            if line_number in descriptions:
+                updated_docstring.append("    - " + descriptions[line_number])
+
+        docstring[:] = updated_docstring
+
+        return docstring
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _parse_parameters(object_name: Any) -> dict:
         """
         Parse parameters from the given function / method object to human
@@ -854,6 +1030,10 @@ class DocstringParser:
         the `Arguments:` section himself / herself and thus there is nothing to
         parse.
 
+        Note:
+            Results are cached per object, because `inspect.signature` is
+            expensive. Don't modify the returned dictionary.
+
         Returns:
             dict:
                 Parameter names with its parsed variant or nothing (no
@@ -869,46 +1049,54 @@ class DocstringParser:
         parameters = inspect.signature(object_name).parameters
         parsed_parameters = {}
 
-        for parameter in parameters:
-            if parameter not in ["self", "cls"]:
-                to_parse = str(parameters[parameter])
-                annotation, default_value = \
-                    PARAMETER_REGEX.search(to_parse).groups()
+        for parameter, signature_parameter in parameters.items():
+            if parameter in SKIPPED_PARAMETERS:
+                continue
 
-                if annotation is None:
-                    annotation = "None"
+            annotation = signature_parameter.annotation
+            default = signature_parameter.default
+            kind = signature_parameter.kind
 
-                if annotation.startswith("typing."):
-                    # Annotation is for example `typing.List`, but this form
-                    # user didn't write. He / she wrote eg. `List[str]`, which
-                    # is internally in Python `typing.List<~T>[str]`.
+            # Read the `Parameter` attributes directly instead of parsing
+            # its string form `name[: annotation][= default]`.
 
-                    bad_annotation = str(parameters[parameter].annotation)
-                    annotation = bad_annotation.replace("typing.", "") \
-                        .replace("<~T>", "")
+            if annotation is inspect.Parameter.empty:
+                annotation = "None"
+            elif getattr(annotation, "__module__", None) == "typing":
+                # Annotation is for example `typing.List`, but this form
+                # user didn't write. He / she wrote eg. `List[str]`, which
+                # is internally in Python `typing.List<~T>[str]`.
 
-                if to_parse.startswith("**"):  # Eg. **kwargs
-                    parameter = "**" + parameter
+                annotation = str(annotation).replace("typing.", "") \
+                    .replace("<~T>", "")
+            else:
+                annotation = inspect.formatannotation(annotation)
 
-                elif to_parse.startswith("*"):  # Eg. *args
-                    parameter = "*" + parameter
+            if default is inspect.Parameter.empty:
+                default_value = None
+            else:
+                default_value = repr(default)
 
-                parsed_parameters[parameter] = "{parameter} ({annotation}" \
-                    .format(parameter=parameter, annotation=annotation)
+            if kind == inspect.Parameter.VAR_KEYWORD:  # Eg. **kwargs
+                parameter = "**" + parameter
 
-                if default_value:
-                    if default_value == "None":
-                        parsed_parameters[parameter] += ", optional"
-                    else:
-                        parsed_parameters[parameter] += \
-                            ", optional, default {default_value}" \
-                            .format(default_value=default_value)
+            elif kind == inspect.Parameter.VAR_POSITIONAL:  # Eg. *args
+                parameter = "*" + parameter
+
+            parsed_parameter = [parameter, " (", annotation]
+
+            if default_value == "None":
+                parsed_parameter.append(", optional")
+            elif default_value:
+                parsed_parameter += [", optional, default ", default_value]
 
-                parsed_parameters[parameter] += "):"
+            parsed_parameter.append("):")
+            parsed_parameters[parameter] = "".join(parsed_parameter)
 
         return parsed_parameters
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _parse_return_annotation(object_name: Any) -> str:
         """
         Parse return annotation from the given function / method object to
@@ -4,26 +4,40 @@ Here are defined main objects for running the following command:
     $ doksit toc
 """
 
+import functools
+import os
 import os.path
-import urllib
+import re
+import unicodedata
 
-from typing import List, Tuple
+from typing import List, Set, Tuple
 
 from doksit.helpers import get_toc_file_path
 from doksit.models import Base, VARIABLE_REGEX
 
 
-BULLET_POINT = {
-    1: "- ",
-    2: 4 * " " + "- ",
-    3: 8 * " " + "- ",
-    4: 12 * " " + "- ",
-    5: 16 * " " + "- ",
-    6: 20 * " " + "- "
-}
+HEADING_REGEX = re.compile(br"(#{1,6}) ")  # Matched against raw bytes.
 
+ANCHOR_TABLE = tuple(  # Indexed by a byte of the lowercased UTF-8 heading.
+    "%{:02x}".format(byte) if byte >= 128  # Part of a non-ASCII character.
+    else "-" if byte == ord(" ")
+    else chr(byte) if chr(byte).isalnum() or chr(byte) in "-_"
+    else ""  # GitHub leaves out the punctuation.
+    for byte in range(256)
+)
 
-class TableOfContents:
+BULLET_POINT = (  # Indexed by a heading level, so the first one is unused.
+    None,
+    "- [",
+    4 * " " + "- [",
+    8 * " " + "- [",
+    12 * " " + "- [",
+    16 * " " + "- [",
+    20 * " " + "- ["
+)
+
+
+class TableOfContents(Base):
     """
     In this class are defined methods for generating the table of contents.
 
@@ -52,13 +66,11 @@ class TableOfContents:
         """
         heading_level, original_heading, encoded_heading = heading
 
-        bullet_point = BULLET_POINT[heading_level]
-        link_description = "[" + original_heading + "]"
-        link_source = "(" + url_path + encoded_heading + ")"
-
-        return bullet_point + link_description + link_source
+        return "".join((BULLET_POINT[heading_level], original_heading, "](",
+                        url_path, encoded_heading, ")"))
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def encode_heading(heading: str) -> str:
         """
         Encode the given heading for a CSS ID attribute.
@@ -67,15 +79,32 @@ class TableOfContents:
             heading:
                 Markdown heading without `#` characters.
 
+        Note:
+            The same headings (eg. "Arguments") repeat a lot, so the results
+            are cached.
+
+            Like on GitHub, letters (also non-ASCII ones) are lowercased,
+            spaces replaced with `-` and the punctuation (also emojis etc.)
+            left out. Non-ASCII letters and digits are percent-encoded.
+
         Returns:
             The encoded heading.
 
         Example:
             "#about-docstrings"
         """
-        encoded_heading = urllib.parse.quote_plus(heading, encoding="utf-8") \
-            .replace("+", "-") \
-            .lower()
+        heading = heading.lower()
+        utf8_heading = heading.encode("utf-8")
+
+        if len(utf8_heading) != len(heading):  # Some non-ASCII characters.
+            utf8_heading = "".join(
+                character for character in heading
+                if character < "\x80" or
+                TableOfContents._is_anchor_character(character)
+            ).encode("utf-8")
+
+        encoded_heading = "".join(
+            [ANCHOR_TABLE[byte] for byte in utf8_heading])
 
         return "#" + encoded_heading
 
@@ -91,48 +120,32 @@ class TableOfContents:
             Metadata about headings. First item is a heading level, second
             origional heading and third an encoded variant.
         """
-        with open(file_path) as file:
-            file_content = file.read()
-
-        split_content = file_content.split("\n")
         is_code_block = False
         headings = []
 
-        for line in split_content:
-            if line.startswith("```"):
-                if is_code_block:
-                    is_code_block = False
-                else:
-                    is_code_block = True
-
-            elif not is_code_block:
-                if line.startswith("# "):
-                    heading = line[2:]
-                    headings.append((1, heading, self.encode_heading(heading)))
-
-                elif line.startswith("## "):
-                    heading = line[3:]
-                    headings.append((2, heading, self.encode_heading(heading)))
-
-                elif line.startswith("### "):
-                    heading = line[4:]
-                    headings.append((3, heading, self.encode_heading(heading)))
+        # The file is read as bytes, so only the headings are decoded.
 
-                elif line.startswith("#### "):
-                    heading = line[5:]
-                    headings.append((4, heading, self.encode_heading(heading)))
+        with open(file_path, "rb") as file:
+            for line in file:  # No need to keep the whole file in memory.
+                if line[:3] == b"```":
+                    is_code_block = not is_code_block
 
-                elif line.startswith("##### "):
-                    heading = line[6:]
-                    headings.append((5, heading, self.encode_heading(heading)))
+                elif not is_code_block and line[:1] == b"#":
+                    match = HEADING_REGEX.match(line)
 
-                elif line.startswith("###### "):
-                    heading = line[7:]
-                    headings.append((6, heading, self.encode_heading(heading)))
+                    if match:
+                        heading_level = match.end(1)  # Number of `#`.
+                        heading = line[heading_level + 1:] \
+                            .rstrip(b"\r\n") \
+                            .decode("utf-8")
+                        headings.append((heading_level, heading,
+                                         self.encode_heading(heading)))
 
         return headings
 
-    def generate_file_toc(self, directory: str, file_path: str) -> str:
+    def generate_file_toc(self, directory: str, file_path: str,
+                          repository_prefix: str=None,
+                          known_files: Set[str]=None) -> str:
         """
         Generate the table of contents for the given file path.
 
@@ -141,6 +154,13 @@ class TableOfContents:
                 Absolute path to the `docs/` directory.
             file_path:
                 Relative path to a Markdown file.
+            repository_prefix:
+                GitHub repository URL prefix (see
+                `doksit.models.Base.repository_prefix`). It will be found out,
+                if it's not given.
+            known_files:
+                Relative paths of all files in the `docs/` directory (see
+                `self.validate_file_path`).
 
         Returns:
             The generated file TOC.
@@ -149,11 +169,15 @@ class TableOfContents:
             - [<file_title>](<absolute_URL_path_to_this_title)
                 - [<heading_level_1](<abs_URL_path_to_this_title)
         """
-        validated_file_path = self.validate_file_path(directory, file_path)
+        validated_file_path = self.validate_file_path(directory, file_path,
+                                                      known_files)
         headings = self.find_headings(validated_file_path)
 
+        if repository_prefix is None:
+            repository_prefix = self.repository_prefix
+
         file_toc = ""
-        url_path = Base().repository_prefix + "docs/" + file_path
+        url_path = repository_prefix + "docs/" + file_path
 
         for heading in headings:
             file_toc += self.create_bullet_point(heading, url_path) + "\n"
@@ -174,19 +198,40 @@ class TableOfContents:
             file_content = file.read()
 
         files = VARIABLE_REGEX.findall(file_content)
-        docs_directory = toc_file_path.rstrip("_toc.md")
+        docs_directory = toc_file_path[:-len("_toc.md")]
+
+        repository_prefix = self.repository_prefix  # Calls Git commands.
+        known_files = set()
+
+        # One walk through the `docs/` directory instead of checking every
+        # template variable on the disk.
+
+        for root, _, file_names in os.walk(docs_directory):
+            relative_root = os.path.relpath(root, docs_directory)
+
+            for file_name in file_names:
+                file_path = os.path.normpath(
+                    os.path.join(relative_root, file_name))
+                known_files.add(file_path.replace(os.sep, "/"))
+
+        file_tocs = {}
 
         for file in files:
-            file_toc = self.generate_file_toc(docs_directory, file)
-            file_variable = "{{ " + file + " }}"
+            if file not in file_tocs:
+                file_tocs[file] = self.generate_file_toc(
+                    docs_directory, file, repository_prefix, known_files)
+
+        # Replace all the template variables in one pass.
 
-            file_content = file_content.replace(file_variable, file_toc)
+        file_content = VARIABLE_REGEX.sub(
+            lambda match: file_tocs[match.group(1)], file_content)
 
         with open(os.path.join(docs_directory, "README.md"), "w") as file:
             file.write(file_content)
 
     @staticmethod
-    def validate_file_path(directory: str, file_path: str) -> str:
+    def validate_file_path(directory: str, file_path: str,
+                           known_files: Set[str]=None) -> str:
         """
         Validate the given file path to a Markdown file.
 
@@ -195,6 +240,10 @@ class TableOfContents:
                 Absolute path to the `docs/` directory
             file_path:
                 Relative path to the Markdown file.
+            known_files:
+                Relative paths (with `/` separators) of all files in the
+                `docs/` directory. If the file path is not among them, it's
+                checked on the disk.
 
         Returns:
             The absolute file path to the Markdown file.
@@ -205,7 +254,9 @@ class TableOfContents:
         """
         absolute_path = os.path.join(directory, file_path)
 
-        if os.path.exists(absolute_path):
+        if known_files is not None and file_path in known_files:
+            pass
+        elif os.path.exists(absolute_path):
             pass
         else:
             message = (
@@ -216,3 +267,19 @@ class TableOfContents:
             raise ValueError(message)
 
         return absolute_path
+
+    @staticmethod
+    def _is_anchor_character(character: str) -> bool:
+        """
+        Whether GitHub keeps the given non-ASCII character in an anchor.
+
+        Arguments:
+            character:
+                One non-ASCII character.
+
+        Returns:
+            True for letters, marks, digits and connector punctuation.
+        """
+        category = unicodedata.category(character)
+
+        return category[0] in "LMN" or category == "Pc"
@@ -3,8 +3,12 @@ Here are defined highlighters (`--smooth` and `--colored` flags) for the
 generated API documentation.
 """
 
+import functools
+import itertools
 import re
 
+from typing import Any, Iterator, TextIO
+
 from click import style
 
 from doksit.models import Base
@@ -28,6 +32,15 @@ HEADERS = (
     "**Warning:**",
     "**Yields:**"
 )
+BOLD_HEADERS = {header: style(header.strip("*"), bold=True)
+                for header in HEADERS}
+
+DISPATCH_REGEX = re.compile(
+    "(?P<heading>" + "|".join(map(re.escape, HEADINGS)) + ")|"
+    "(?P<header>" + "|".join(map(re.escape, HEADERS)) + ")|"
+    r"(?P<link>\[source\]\(http)"
+)
+DISPATCH_CHARACTERS = frozenset("#*[")  # First characters of the above.
 
 
 class SmoothHighlighter(Base):
@@ -35,7 +48,7 @@ class SmoothHighlighter(Base):
     Class for the `--smooth` flag of the `doksit api` command.
     """
 
-    __slots__ = ("documentation")
+    __slots__ = ("documentation",)
 
     def __init__(self, documentation: str) -> None:
         """
@@ -52,34 +65,70 @@ class SmoothHighlighter(Base):
         Returns:
             Smooth API documentation output.
         """
-        split_doc = self.documentation.split("\n")
+        return "\n".join(self.iter_api_documentation())
+
+    def iter_api_documentation(self) -> Iterator[str]:
+        """
+        Yields:
+            Lines of the smooth API documentation output.
+        """
+        lines = iter(self.documentation.split("\n"))
         is_example_section = False
 
-        for line_number, line in enumerate(split_doc):
+        # Links to a module are placed right after its heading and 1 blank
+        # line, so it's remembered which of the last two lines was a module
+        # heading.
+
+        before_last_is_module = last_is_module = False
+
+        for line in lines:
+            is_after_module = before_last_is_module
+            before_last_is_module, last_is_module = last_is_module, False
+
             if line.startswith("```"):
-                if is_example_section:
-                    is_example_section = False
-                else:
-                    is_example_section = True
+                is_example_section = not is_example_section
+                yield line
 
-            elif not is_example_section:
-                if line.startswith(HEADINGS):
-                    split_doc[line_number] = style(line, bold=True)
+            elif is_example_section or line[:1] not in DISPATCH_CHARACTERS:
+                yield line
 
-                elif line in HEADERS:
-                    split_doc[line_number] = style(line.strip("*"), bold=True)
+            else:
+                match = DISPATCH_REGEX.match(line)
 
-                elif line.startswith("[source](http"):
-                    if split_doc[line_number - 2].startswith("\x1b[1m## "):
-                        # Links to a module will be removed, because they are
-                        # duplicate with Python module path + 1 blank line.
+                if match is None:
+                    yield line
 
-                        del split_doc[line_number]
-                        del split_doc[line_number]
-                    else:
-                        split_doc[line_number] = self._modify_link(line)
+                elif match.lastgroup == "heading":
+                    last_is_module = match.group("heading") == "## "
+                    yield style(line, bold=True)
+
+                elif match.lastgroup == "header":
+                    yield BOLD_HEADERS.get(line, line)
 
-        return "\n".join(split_doc)
+                elif is_after_module:
+                    # Links to a module will be removed, because they are
+                    # duplicate with Python module path + 1 blank line. The
+                    # line after them is kept as it is.
+
+                    next(lines, None)
+                    next_line = next(lines, None)
+
+                    if next_line is not None:
+                        yield next_line
+                else:
+                    yield self._modify_link(line)
+
+    def write_api_documentation(self, file: TextIO) -> None:
+        """
+        Write the API documentation output into the given file line by line,
+        so the whole output isn't kept in memory.
+
+        Arguments:
+            file:
+                Opened file (eg. standard input of a pager).
+        """
+        for line in self.iter_api_documentation():
+            file.write(line + "\n")
 
     def _modify_link(self, line: str) -> str:
         """
@@ -95,16 +144,65 @@ class SmoothHighlighter(Base):
         Example:
             "-> doksit.api#L1-L10"
         """
-        line = line.replace("[source](", "") \
-            .replace(self.repository_prefix, "")
+        repository_prefix = self.repository_prefix
+        match = self._get_link_regex(repository_prefix).match(line)
+
+        if match:
+            return "-> " + match.group(1)
+
+        # The link isn't closed (eg. it's only a text in a docstring).
 
-        return "-> " + line[:-1]  # Last character is ")"
+        line = line.replace("[source](", "").replace(repository_prefix, "")
+
+        return "-> " + line[:-1]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_link_regex(repository_prefix: str) -> Any:
+        """
+        Compile a regular expression for links to source codes on GitHub.
+
+        Arguments:
+            repository_prefix:
+                See `doksit.models.Base.repository_prefix`.
+
+        Returns:
+            The compiled regular expression. The first group is a file path
+            with optional object location.
+        """
+        return re.compile(
+            r"\[source\]\((?:" + re.escape(repository_prefix) + r")?(.*)\)")
 
 
 START = "\x1b["
 END = "\x1b[K\x1b[0m"
 
-INLINE_CODE_REGEX = re.compile(r"`[^`]+`")
+# Whole escape sequences are prepared here, so they aren't concatenated again
+# for each line.
+
+TITLE_START = START + "31;40;1m"
+MODULE_START = START + "34;40;1m"
+CLASS_START = START + "32;40;1m"
+METHOD_START = START + "33;40;1m"
+FUNCTION_START = START + "36;40;1m"
+HEADER_START = START + "97;40;1m"
+CODE_START = START + "30;107m"
+REST_START = START + "97;40m"
+EMPTY_LINE = REST_START + END  # Blank lines are very common.
+
+COLORED_HEADERS = {header: HEADER_START + header.strip("*") + END
+                   for header in HEADERS}
+HEADING_COLORS = {  # Keys are heading prefixes matched by `DISPATCH_REGEX`.
+    HEADINGS[0]: TITLE_START,
+    HEADINGS[1]: MODULE_START,
+    HEADINGS[2]: CLASS_START,
+    HEADINGS[3]: METHOD_START,
+    HEADINGS[4]: METHOD_START,
+    HEADINGS[5]: METHOD_START,
+    HEADINGS[6]: FUNCTION_START
+}
+
+INLINE_CODE_REGEX = re.compile(r"`([^`\n]+)`", re.ASCII)
 
 
 class ColoredHighlighter(SmoothHighlighter):
@@ -126,71 +224,92 @@ class ColoredHighlighter(SmoothHighlighter):
     | rest of documentation | white | black | no |
     """
 
-    def __init__(self, *args) -> None:
-        """
-        Initialize an instance of `ColoredHiglihter` class.
+    __slots__ = ()
 
-        Arguments:
-            *args:
-                Same arguments like for the `SmoothHiglighter` constructor.
-        """
-        super().__init__(*args)
-
-    def get_api_documentation(self) -> str:
+    def iter_api_documentation(self) -> Iterator[str]:
         """
-        Returns:
-            Colored API documentation output.
+        Yields:
+            Lines of the colored API documentation output.
         """
-        split_doc = self.documentation.split("\n")
-        is_example_section = False
+        lines = iter(self.documentation.split("\n"))
 
-        for line_number, line in enumerate(split_doc):
-            if line.startswith("```"):
-                split_doc[line_number] = START + "30;107m" + line + END
+        # Methods are bound to local names once, because attribute lookups
+        # would be repeated for each line.
+
+        color_header = self._color_header
+        color_rest = self._color_rest
+        is_code = self._is_code
+        dispatch = DISPATCH_REGEX.match
 
-                if is_example_section:
-                    is_example_section = False
+        # Links to a module are placed right after its heading and 1 blank
+        # line, so it's remembered which of the last two lines was a module
+        # heading.
 
-                    del split_doc[line_number]
+        before_last_is_module = last_is_module = False
 
-                    # Fix foreground and background color for the line now
-                    # placed in this index.
+        for line in lines:
+            is_after_module = before_last_is_module
+            before_last_is_module, last_is_module = last_is_module, False
 
-                    split_doc[line_number] = \
-                        self._color_rest(split_doc[line_number])
+            if line.startswith("```"):
+                # The whole code block is colored at once. `takewhile` also
+                # consumes the closing line, so it's left out and the next
+                # one gets the foreground and background color of the rest.
+
+                yield CODE_START + line + END
+                yield from (
+                    CODE_START + code_line + END for code_line in
+                    itertools.takewhile(is_code, lines)
+                )
+                next_line = next(lines, None)
+                before_last_is_module = False
+
+                if next_line is not None:
+                    yield color_rest(next_line)
+
+            elif not line:
+                yield EMPTY_LINE
+
+            else:
+                # Most of lines can't be a heading, header or link, so only
+                # the others are matched against the regular expression.
+
+                if line[0] in DISPATCH_CHARACTERS:
+                    match = dispatch(line)
                 else:
-                    is_example_section = True
+                    match = None
 
-            elif is_example_section:
-                split_doc[line_number] = START + "30;107m" + line + END
+                if match is None:
+                    if "`" in line:
+                        yield color_rest(line)
+                    else:
+                        yield REST_START + line + END
 
-            elif not is_example_section:
-                if line.startswith(HEADINGS):
-                    split_doc[line_number] = self._color_heading(line)
+                elif match.lastgroup == "heading":
+                    heading = match.group("heading")
+                    last_is_module = heading == "## "
+                    yield HEADING_COLORS[heading] + line + END
 
-                elif line.startswith(HEADERS):
-                    split_doc[line_number] = self._color_header(line)
+                elif match.lastgroup == "header":
+                    colored_header = COLORED_HEADERS.get(line)
 
-                elif line.startswith("[source](http"):
-                    if "34;40;1m" in split_doc[line_number - 2]:  # Module.
-                        # Links to a module will be removed, because they are
-                        # duplicate with Python module path.
+                    if colored_header is None:  # Some text after the header.
+                        colored_header = color_header(line)
 
-                        del split_doc[line_number]
-                        del split_doc[line_number]  # Blank line.
+                    yield colored_header
 
-                        # Fix foreground and background color for the line now
-                        # placed in this index.
+                elif is_after_module:
+                    # Links to a module will be removed (including the blank
+                    # line after), because they are duplicate with Python
+                    # module path.
 
-                        split_doc[line_number] = \
-                            self._color_rest(split_doc[line_number])
-                    else:
-                        split_doc[line_number] = self._modify_link(line)
+                    next(lines, None)
+                    next_line = next(lines, None)
 
+                    if next_line is not None:
+                        yield color_rest(next_line)
                 else:
-                    split_doc[line_number] = self._color_rest(line)
-
-        return "\n".join(split_doc)
+                    yield self._modify_link(line)
 
     @staticmethod
     def _color_heading(line: str) -> str:
@@ -217,22 +336,10 @@ class ColoredHighlighter(SmoothHighlighter):
         Returns:
             The colored heading.
         """
-        if line.startswith(HEADINGS[0]):
-            return START + "31;40;1m" + line + END
-
-        elif line.startswith(HEADINGS[1]):
-            return START + "34;40;1m" + line + END
-
-        elif line.startswith(HEADINGS[2]):
-            return START + "32;40;1m" + line + END
-
-        elif line.startswith(HEADINGS[3]) \
-                or line.startswith(HEADINGS[4]) \
-                or line.startswith(HEADINGS[5]):
-            return START + "33;40;1m" + line + END
+        match = DISPATCH_REGEX.match(line)
 
-        elif line.startswith(HEADINGS[6]):
-            return START + "36;40;1m" + line + END
+        if match is not None and match.lastgroup == "heading":
+            return HEADING_COLORS[match.group("heading")] + line + END
 
     @staticmethod
     def _color_header(line: str) -> str:
@@ -251,7 +358,7 @@ class ColoredHighlighter(SmoothHighlighter):
         Returns:
             The colored header.
         """
-        return START + "97;40;1m" + line.strip("*") + END
+        return HEADER_START + line.strip("*") + END
 
     def _modify_link(self, line: str) -> str:
         """
@@ -272,11 +379,7 @@ class ColoredHighlighter(SmoothHighlighter):
         Example:
             "-> doksit/api.py#L10-L20"  # Without colors here.
         """
-        line = line \
-            .replace("[source](", "") \
-            .replace(self.repository_prefix, "")
-
-        return START + "97;40m" + "-> " + line[:-1] + END  # -1 is ")".
+        return REST_START + super()._modify_link(line) + END
 
     def _color_rest(self, line: str) -> str:
         """
@@ -295,9 +398,14 @@ class ColoredHighlighter(SmoothHighlighter):
             The highlighted line.
         """
         if "`" in line:
-            line = self._color_inline_code(line)
+            line = REST_START + self._color_inline_code(line) + END
+
+            # The colors would be switched twice for an inline code at the
+            # beginning of the line or right after another one.
+
+            return line.replace(REST_START + CODE_START, CODE_START)
 
-        return START + "97;40m" + line + END
+        return REST_START + line + END
 
     @staticmethod
     def _color_inline_code(line: str) -> str:
@@ -319,14 +427,22 @@ class ColoredHighlighter(SmoothHighlighter):
         Returns:
             The colored inline code in that line.
         """
-        inline_codes = INLINE_CODE_REGEX.findall(line)
+        # Backticks are left out of the group and the color is switched back
+        # for the rest of text, all in one pass through the line.
 
-        for inline_code in inline_codes:
-            colored_inline_code = START + "30;107m" + inline_code \
-                + START + "97;40m"  # For the rest of text.
+        return INLINE_CODE_REGEX.sub(
+            lambda match: CODE_START + match.group(1) + REST_START, line)
 
-            line = line \
-                .replace(inline_code, colored_inline_code) \
-                .replace("`", "", 2)
+    @staticmethod
+    def _is_code(line: str) -> bool:
+        """
+        Check if the given line is still inside a code block.
 
-        return line
+        Arguments:
+            line:
+                Line from an example section.
+
+        Returns:
+            False for the closing line of the code block, otherwise True.
+        """
+        return not line.startswith("```")
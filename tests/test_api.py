@@ -1,3 +1,9 @@
+import types
+
+from unittest import mock
+
+import pytest
+
 from click.testing import CliRunner
 
 from doksit.cli import api
@@ -5,6 +11,15 @@ from doksit.cli import api
 RUNNER = CliRunner()
 
 
+@pytest.fixture
+def tty_stdout(monkeypatch):
+    """
+    Pretend the output goes to a terminal (`CliRunner` never uses one).
+    """
+    stdout = types.SimpleNamespace(isatty=lambda: True)
+    monkeypatch.setattr("doksit.cli.sys", types.SimpleNamespace(stdout=stdout))
+
+
 def test_api_subcommand():
     result = RUNNER.invoke(api, ["-p", "test_data"])
 
@@ -50,3 +65,55 @@ def test_api_subcommand_with_colored_flag():
     result = RUNNER.invoke(api, ["-p", "test_data/", "--colored"])
 
     assert result.exit_code == 0
+
+
+def test_api_subcommand_with_colored_flag_without_terminal(monkeypatch):
+    stdout = types.SimpleNamespace(isatty=lambda: False)
+    monkeypatch.setattr("doksit.cli.sys", types.SimpleNamespace(stdout=stdout))
+    popen = mock.Mock()
+
+    with mock.patch("subprocess.Popen", popen):
+        result = RUNNER.invoke(api, ["-p", "test_data/", "--colored"])
+
+    assert result.exit_code == 0
+    assert "API Reference" in result.output
+    assert "\x1b[" not in result.output
+    assert not popen.called
+
+
+@pytest.mark.usefixtures("tty_stdout")
+def test_api_subcommand_with_colored_flag_in_terminal():
+    less = mock.Mock()
+
+    with mock.patch("subprocess.Popen", return_value=less):
+        result = RUNNER.invoke(api, ["-p", "test_data/", "--colored"])
+
+    written = "".join(call[0][0] for call in less.stdin.write.call_args_list)
+
+    assert result.exit_code == 0
+    assert "\x1b[31;40;1m# API Reference" in written
+    assert less.stdin.close.called
+    assert less.wait.called
+
+
+@pytest.mark.usefixtures("tty_stdout")
+def test_api_subcommand_with_colored_flag_and_quit_less():
+    less = mock.Mock()
+    less.stdin.write.side_effect = BrokenPipeError
+
+    with mock.patch("subprocess.Popen", return_value=less):
+        result = RUNNER.invoke(api, ["-p", "test_data/", "--colored"])
+
+    assert result.exit_code == 0
+    assert less.wait.called
+
+
+@pytest.mark.usefixtures("tty_stdout")
+def test_api_subcommand_with_colored_flag_without_less():
+    popen = mock.Mock(side_effect=FileNotFoundError)
+
+    with mock.patch("subprocess.Popen", popen):
+        result = RUNNER.invoke(api, ["-p", "test_data/", "--colored"])
+
+    assert result.exit_code == 0
+    assert "API Reference" in result.output
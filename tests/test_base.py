@@ -8,8 +8,8 @@ import yaml
 
 from doksit.cli import api
 from doksit.models import (
-    Base, BRANCH_NAME_REGEX, CLASS_REGEX, FUNCTION_REGEX, METHOD_REGEX,
-    REPOSITORY_URL_REGEX, STATIC_METHOD_REGEX, VARIABLE_REGEX
+    Base, CLASS_REGEX, FUNCTION_REGEX, METHOD_REGEX, STATIC_METHOD_REGEX,
+    VARIABLE_REGEX
 )
 
 from tests.test_data import module
@@ -48,15 +48,23 @@ def test_config():
     assert not base.config
 
 
-###############################################################################
+def test_cached_config_load():
+    with open(".doksit.yml", "w") as file:
+        file.write("docstring: doksit")
 
+    assert base.config == {"docstring": "doksit"}
+    assert base.config == {"docstring": "doksit"}
+    assert not os.path.exists(".doksit_cache")
+
+    with open(".doksit.yml", "w") as file:
+        file.write("docstring: numpy")
+
+    assert base.config == {"docstring": "numpy"}
+
+    os.remove(".doksit.yml")
 
-@pytest.mark.parametrize("data", [
-    "* dev\n",
-    "  master\n* dev\n  nait"
-])
-def test_branch_name_regex(data):
-    assert BRANCH_NAME_REGEX.search(data).group(1) == "dev"
+
+###############################################################################
 
 
 def test_current_branch():
@@ -100,16 +108,6 @@ def test_not_found_repository_prefix():
 ###############################################################################
 
 
-def test_repository_url_regex():
-    data = (
-        "origin\thttps://github.com/nait-aul/doksit (fetch)\n"
-        "origin\thttps://github.com/nait-aul/doksit (push)\n"
-    )
-    expected_output = "https://github.com/nait-aul/doksit"
-
-    assert REPOSITORY_URL_REGEX.search(data).group(1) == expected_output
-
-
 def test_repository_url():
     assert "https://github.com/nait-aul/doksit" in base.repository_url
 
@@ -119,6 +117,62 @@ def test_not_found_repository_url():
     assert not base.repository_url
 
 
+def test_read_git_files():
+    current_directory = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        os.mkdir(os.path.join(temporary_directory, ".git"))
+
+        with open(os.path.join(temporary_directory, ".git", "HEAD"),
+                  "w") as file:
+            file.write("ref: refs/heads/dev\n")
+
+        with open(os.path.join(temporary_directory, ".git", "config"),
+                  "w") as file:
+            file.write(
+                '[remote "origin"]\n'
+                "\turl = https://github.com/nait-aul/doksit.git\n"
+                "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+            )
+
+        os.chdir(temporary_directory)
+
+        try:
+            current_branch = base.current_branch
+            repository_url = base.repository_url
+        finally:
+            os.chdir(current_directory)
+
+    assert current_branch == "dev"
+    assert repository_url == "https://github.com/nait-aul/doksit"
+
+
+def test_detached_current_branch_in_subdirectory():
+    current_directory = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        os.chdir(temporary_directory)
+
+        try:
+            git = ["git", "-c", "user.name=doksit",
+                   "-c", "user.email=doksit@example.com"]
+            subprocess.check_call(git + ["init", "-q"])
+            subprocess.check_call(
+                git + ["commit", "-q", "--allow-empty", "-m", "Init"])
+            subprocess.check_call(git + ["checkout", "-q", "--detach"])
+            commit_hash = subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], universal_newlines=True).strip()
+
+            os.mkdir("subdirectory")
+            os.chdir("subdirectory")
+
+            current_branch = base.current_branch
+        finally:
+            os.chdir(current_directory)
+
+    assert current_branch == commit_hash
+
+
 def test_clone_repository_and_get_repository_url():
     current_directory = os.getcwd()
     has_git = True
@@ -307,3 +361,12 @@ def test_read_file():
     ]
     assert result[1]["Bar"] == []
     assert result[2] == ["function", "another_function"]
+
+
+def test_read_files():
+    file_paths = ["test_data/module.py", "test_data/blank.py"]
+    result = base.read_files(file_paths)
+
+    assert [metadata[0] for metadata in result] == file_paths
+    assert result[0] == base.read_file("test_data/module.py")
+    assert base.read_files([]) == []
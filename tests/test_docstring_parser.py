@@ -28,6 +28,14 @@ parser = DocstringParser()
         "    y (float, optional, default 1.0): Description of 'y'.",
         "    z (List[int], optional): Description of 'z'.",
         ""
+    ],
+    [
+        "Arguments:",
+        "    x : Description of",
+        "        'x'.",
+        "    y : Description of 'y'.",
+        "    z : Description of 'z'.",
+        ""
     ]
 ])
 def test_markdown_arguments_section(docstring):
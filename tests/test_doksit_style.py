@@ -228,6 +228,27 @@ def test_get_markdowned_docstring_for_method_foo_method():
     assert example in docstring
 
 
+def test_get_markdowned_docstring_is_cached():
+    docstring = doksit.get_markdowned_docstring(module.function)
+
+    assert docstring is doksit.get_markdowned_docstring(module.function)
+
+
+def test_get_markdowned_docstring_with_overridden_section():
+    class CustomStyle(DoksitStyle):
+        def markdown_note_section(self, line_number, docstring):
+            docstring[line_number] = "**Custom note:**\n"
+
+            return docstring
+
+    doksit.get_markdowned_docstring(module.Foo)  # Cached for `doksit` only.
+    docstring = CustomStyle("test_data", "API") \
+        .get_markdowned_docstring(module.Foo)
+
+    assert "**Custom note:**\n" in docstring
+    assert "**Note:**" not in docstring
+
+
 def test_get_markdowned_docstring_for_function_function():
     docstring = doksit.get_markdowned_docstring(module.function)
 
@@ -42,6 +42,18 @@ def test_encode_heading():
     assert "#about-me" == toc.encode_heading("About Me")
 
 
+@pytest.mark.parametrize("heading,encoded", [
+    ("What is Doksit?", "#what-is-doksit"),
+    ("doksit.api", "#doksitapi"),
+    ("snake_case-name", "#snake_case-name"),
+    ("Čau", "#%c4%8dau"),
+    ("Doksit — docs", "#doksit--docs"),
+    ("Don’t 🚀 launch", "#dont--launch"),
+])
+def test_encode_heading_like_github(heading, encoded):
+    assert encoded == toc.encode_heading(heading)
+
+
 ###############################################################################
 
 
@@ -105,6 +117,14 @@ def test_validate_file_path():
     assert result == os.path.join(directory, file_path)
 
 
+def test_validate_file_path_with_known_files():
+    directory = os.path.join(os.getcwd(), "docs")
+    file_path = "not_on_disk.md"
+    result = toc.validate_file_path(directory, file_path, {"not_on_disk.md"})
+
+    assert result == os.path.join(directory, file_path)
+
+
 def test_validate_file_path_with_raised_error():
     directory = os.path.join(os.getcwd(), "docs")
     file_path = "blablabla.md"
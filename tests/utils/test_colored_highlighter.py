@@ -79,12 +79,22 @@ def test_color_rest_with_inline_code_in():
     assert "97;40m" in colored_line
 
 
+def test_color_rest_without_redundant_escape_sequences():
+    text = "`a``b` code"
+    colored_line = COLORED._color_rest(text)
+
+    assert colored_line == (
+        "\x1b[30;107ma\x1b[30;107mb\x1b[97;40m code\x1b[K\x1b[0m"
+    )
+
+
 ###############################################################################
 
 @pytest.mark.parametrize("code,result", [
-    ("This is an `inline code`", ["`inline code`"]),
-    ("`doksit.api.DoksitStyle`", ["`doksit.api.DoksitStyle`"]),
-    ("Multiple codes `a` and `b`", ["`a`", "`b`"])
+    ("This is an `inline code`", ["inline code"]),
+    ("`doksit.api.DoksitStyle`", ["doksit.api.DoksitStyle"]),
+    ("Multiple codes `a` and `b`", ["a", "b"]),
+    ("Not a code `a\nb`", [])
 ])
 def test_inline_code_regex(code, result):
     assert INLINE_CODE_REGEX.findall(code) == result
@@ -96,3 +106,12 @@ def test_color_inline_code():
 
     assert "`" not in colored_line
     assert "30;107m" in colored_line
+
+
+def test_color_multiple_inline_codes():
+    sample_line = "Codes `a` and `a`."
+    colored_line = COLORED._color_inline_code(sample_line)
+
+    assert colored_line == (
+        "Codes \x1b[30;107ma\x1b[97;40m and \x1b[30;107ma\x1b[97;40m."
+    )
@@ -1,3 +1,5 @@
+import io
+
 from doksit.models import Base
 from doksit.utils.highlighters import SmoothHighlighter
 
@@ -12,6 +14,14 @@ def test_get_smooth_api_documentation(documentation):
     assert "[source](" not in smooth_doc
 
 
+def test_write_smooth_api_documentation(documentation):
+    smooth = SmoothHighlighter(documentation)
+    file = io.StringIO()
+    smooth.write_api_documentation(file)
+
+    assert file.getvalue() == smooth.get_api_documentation() + "\n"
+
+
 ###############################################################################
 
 
@@ -23,3 +33,12 @@ def test_modify_link():
     modified_link = "-> test_data/module.py"
 
     assert modified_link == smooth._modify_link(original_link)
+
+
+def test_modify_unclosed_link():
+    smooth = SmoothHighlighter("blabla")
+
+    original_link = "[source](http://example.com/x"
+    modified_link = "-> http://example.com/"
+
+    assert modified_link == smooth._modify_link(original_link)